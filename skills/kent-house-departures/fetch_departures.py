@@ -5,18 +5,25 @@ import json
 import urllib.request
 import urllib.error
 import ssl
-from datetime import datetime
+from collections import deque
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from itertools import islice
 import os
+import threading
+import time
 
 CONFIG_FILE = "/data/.openclaw/workspace/skills/kent-house-departures/config.json"
 OUTPUT_HTML = "/data/.openclaw/workspace/skills/kent-house-departures/departure_board.html"
+TIMETABLE_CACHE = "/data/.openclaw/workspace/skills/kent-house-departures/timetable_cache.json"
+TIMETABLE_LOOKAHEAD = "PT04:00:00"  # how far into tomorrow the preload reaches
 
 def load_config():
     with open(CONFIG_FILE, 'r') as f:
         return json.load(f)
 
-def fetch_transportapi_departures(config):
-    """Fetch departures using TransportAPI"""
+def request_transportapi(config, params):
+    """Call the TransportAPI station timetable endpoint and return raw JSON"""
     app_id = config['transportApi']['appId']
     api_key = config['transportApi']['apiKey']
     station_code = config['stationCode']
@@ -26,20 +33,26 @@ def fetch_transportapi_departures(config):
     
     # TransportAPI endpoint for live departures (updated)
     url = f"https://transportapi.com/v3/uk/train/station_timetables/{station_code}.json"
-    params = f"?app_id={app_id}&app_key={api_key}&live=true"
+    query = f"?app_id={app_id}&app_key={api_key}&{params}"
     
     try:
         ctx = ssl.create_default_context()
-        req = urllib.request.Request(url + params, method='GET')
+        req = urllib.request.Request(url + query, method='GET')
         with urllib.request.urlopen(req, context=ctx, timeout=10) as response:
-            data = json.loads(response.read().decode('utf-8'))
-            return parse_transportapi_data(data), None
+            return json.loads(response.read().decode('utf-8')), None
     except urllib.error.HTTPError as e:
         error_body = e.read().decode('utf-8')
         return None, f"API Error: {e.code} - {e.reason}. {error_body}"
     except Exception as e:
         return None, f"Error: {str(e)}"
 
+def fetch_transportapi_departures(config):
+    """Fetch departures using TransportAPI"""
+    data, error = request_transportapi(config, "live=true")
+    if error:
+        return None, error
+    return parse_transportapi_data(data), None
+
 def parse_transportapi_data(data):
     """Parse TransportAPI response into standard format"""
     departures = []
@@ -62,70 +75,197 @@ def parse_transportapi_data(data):
         'departures': departures
     }
 
-def generate_html(data, config):
-    """Generate HTML departure board"""
-    if not data:
-        return generate_error_html("No data available")
+def parse_clock(hhmm, base):
+    """Place an HH:MM time on the date that puts it nearest to base"""
+    try:
+        clock = datetime.strptime(hhmm, '%H:%M')
+    except (TypeError, ValueError):
+        return None
     
-    station_name = config.get('stationName', 'Kent House')
-    refresh_interval = config.get('refreshInterval', 60)
-    now_str = data['timestamp']
+    moment = base.replace(hour=clock.hour, minute=clock.minute, second=0, microsecond=0)
+    if moment - base > timedelta(hours=12):
+        moment -= timedelta(days=1)
+    elif base - moment > timedelta(hours=12):
+        moment += timedelta(days=1)
+    return moment
+
+def departure_key(train_uid, scheduled_at):
+    """Identify a service across timetable and live responses"""
+    return f"{train_uid}|{scheduled_at.strftime('%Y-%m-%d %H:%M')}"
+
+def load_cached_timetable(today, station_code):
+    """Return today's cached timetable, or None if missing or stale"""
+    try:
+        with open(TIMETABLE_CACHE, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
     
-    # Build departure rows
-    departure_rows = []
-    for dep in data['departures']:
-        status_class = 'ontime'
-        status_text = 'On Time'
-        time_class = ''
-        
-        if dep['cancelled']:
-            status_class = 'cancelled'
-            status_text = 'Cancelled'
-        elif dep['expected'] != dep['scheduled'] and dep['expected']:
-            status_class = 'delayed'
-            status_text = f"Exp {dep['expected']}"
-            time_class = 'delayed'
+    if cache.get('date') != today or cache.get('stationCode') != station_code:
+        return None
+    return cache
+
+def fetch_timetable_day(config, day, to_offset):
+    """Fetch one day's static timetable, starting at midnight"""
+    params = f"live=false&date={day.strftime('%Y-%m-%d')}&time=00:00&to_offset={to_offset}"
+    data, error = request_transportapi(config, params)
+    if error:
+        return None, error
+    
+    services = []
+    for dep in data.get('departures', {}).get('all', []):
+        scheduled_at = parse_clock(dep.get('aimed_departure_time'), day.replace(hour=12))
+        if not scheduled_at:
+            continue
+        services.append({
+            'key': departure_key(dep.get('train_uid', ''), scheduled_at),
+            'scheduledAt': scheduled_at.isoformat(),
+            'scheduled': dep.get('aimed_departure_time', ''),
+            'destination': dep.get('destination_name', 'Unknown'),
+            'platform': dep.get('platform', 'TBC'),
+            'operator': dep.get('operator_name', '')
+        })
+    return (data, services), None
+
+def fetch_static_timetable(config):
+    """Fetch the static timetable once per day and cache it on disk
+    
+    Tomorrow's early services are included so the board doesn't run dry
+    late in the evening.
+    """
+    now = datetime.now()
+    today = now.strftime('%Y-%m-%d')
+    station_code = config['stationCode']
+    cache = load_cached_timetable(today, station_code)
+    if cache:
+        return cache, None
+    
+    result, error = fetch_timetable_day(config, now, "PT23:59:00")
+    if error:
+        return None, error
+    data, services = result
+    
+    cache = {
+        'date': today,
+        'stationCode': station_code,
+        'station': data.get('station_name', config.get('stationName', 'Kent House')),
+        'departures': services
+    }
+    
+    result, error = fetch_timetable_day(config, now + timedelta(days=1), TIMETABLE_LOOKAHEAD)
+    if error:
+        # Use today's services for this poll but don't cache them, so the
+        # next poll retries the lookahead
+        print(f"⚠️  Could not preload tomorrow's early services: {error}")
+        return cache, None
+    services += result[1]
+    
+    try:
+        with open(TIMETABLE_CACHE, 'w') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"⚠️  Could not write timetable cache: {e}")
+    
+    return cache, None
+
+def fetch_live_updates(config):
+    """Fetch only the realtime fields, keyed by service"""
+    data, error = request_transportapi(config, "live=true")
+    if error:
+        return None, error
+    
+    now = datetime.now()
+    updates = {}
+    for dep in data.get('departures', {}).get('all', []):
+        scheduled_at = parse_clock(dep.get('aimed_departure_time'), now)
+        if not scheduled_at:
+            continue
+        key = departure_key(dep.get('train_uid', ''), scheduled_at)
+        updates[key] = {
+            'key': key,
+            'scheduledAt': scheduled_at.isoformat(),
+            'scheduled': dep.get('aimed_departure_time', ''),
+            'expected': dep.get('expected_departure_time'),
+            'destination': dep.get('destination_name', 'Unknown'),
+            'platform': dep.get('platform'),
+            'status': dep.get('status', ''),
+            'operator': dep.get('operator_name', '')
+        }
+    return updates, None
+
+def fetch_preloaded_departures(config):
+    """Overlay live updates onto the cached daily timetable
+    
+    Live services missing from the timetable (short-notice additions,
+    replacements) are shown too. If the live feed is unavailable the
+    scheduled services are still returned, flagged with live=False so
+    the board can say so; if the timetable is unavailable the plain live
+    fetch is used instead.
+    """
+    timetable, error = fetch_static_timetable(config)
+    if error:
+        print(f"⚠️  Timetable unavailable, falling back to live departures: {error}")
+        return fetch_transportapi_departures(config)
+    
+    updates, live_error = fetch_live_updates(config)
+    if live_error:
+        print(f"⚠️  Live feed unavailable, showing timetable: {live_error}")
+        updates = {}
+    
+    now = datetime.now().replace(second=0, microsecond=0)
+    max_departures = config.get('maxDepartures', 10)
+    
+    services = list(timetable['departures'])
+    known = {service['key'] for service in services}
+    services += [update for key, update in updates.items() if key not in known]
+    
+    candidates = []
+    for service in services:
+        scheduled_at = datetime.fromisoformat(service['scheduledAt'])
+        update = updates.get(service['key'], {})
+        expected = update.get('expected') or service['scheduled']
+        expected_at = parse_clock(expected, scheduled_at) or scheduled_at
+        if expected_at < now:
+            continue
         
-        row = f'''<div class="departure">
-                <div class="time {time_class}">{dep['scheduled']}</div>
-                <div class="destination">{dep['destination']}</div>
-                <div class="platform">{dep['platform']}</div>
-                <div class="status {status_class}">
-                    <span class="status-icon {status_class}"></span>
-                    {status_text}
-                </div>
-            </div>'''
-        departure_rows.append(row)
+        status = update.get('status') or 'Scheduled'
+        candidates.append((scheduled_at, {
+            'scheduled': service['scheduled'],
+            'expected': expected,
+            'destination': service['destination'],
+            'platform': update.get('platform') or service['platform'] or 'TBC',
+            'status': status,
+            'operator': service['operator'],
+            'cancelled': status.lower() == 'cancelled'
+        }))
     
-    departures_html = '\n'.join(departure_rows) if departure_rows else '''
-            <div class="empty-state">
-                <div class="empty-state-icon">🚫</div>
-                <div>No departures found at this time</div>
-            </div>'''
+    candidates.sort(key=lambda candidate: candidate[0])
+    departures = [dep for _, dep in candidates[:max_departures]]
     
-    html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{station_name} Station - Live Departures</title>
-    <style>
-        * {{
+    return {
+        'station': timetable['station'],
+        'timestamp': datetime.now().strftime('%H:%M:%S'),
+        'departures': departures,
+        'live': live_error is None
+    }, None
+
+BOARD_CSS = """\
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
-        body {{
+        }
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
             background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
             min-height: 100vh;
             padding: 20px;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 800px;
             margin: 0 auto;
-        }}
-        .header {{
+        }
+        .header {
             background: rgba(255, 255, 255, 0.1);
             backdrop-filter: blur(10px);
             border-radius: 16px;
@@ -133,25 +273,25 @@ def generate_html(data, config):
             margin-bottom: 20px;
             color: white;
             border: 1px solid rgba(255, 255, 255, 0.2);
-        }}
-        .header h1 {{
+        }
+        .header h1 {
             font-size: 28px;
             margin-bottom: 8px;
             display: flex;
             align-items: center;
             gap: 12px;
-        }}
-        .header .subtitle {{
+        }
+        .header .subtitle {
             opacity: 0.8;
             font-size: 14px;
-        }}
-        .board {{
+        }
+        .board {
             background: rgba(255, 255, 255, 0.95);
             border-radius: 16px;
             overflow: hidden;
             box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3);
-        }}
-        .board-header {{
+        }
+        .board-header {
             background: #003366;
             color: white;
             padding: 16px 20px;
@@ -162,39 +302,39 @@ def generate_html(data, config):
             font-size: 13px;
             text-transform: uppercase;
             letter-spacing: 0.5px;
-        }}
-        .departure {{
+        }
+        .departure {
             display: grid;
             grid-template-columns: 80px 1fr 60px 100px;
             gap: 12px;
             padding: 16px 20px;
             border-bottom: 1px solid #e0e0e0;
             transition: background 0.2s;
-        }}
-        .departure:hover {{
+        }
+        .departure:hover {
             background: #f5f5f5;
-        }}
-        .departure:last-child {{
+        }
+        .departure:last-child {
             border-bottom: none;
-        }}
-        .time {{
+        }
+        .time {
             font-weight: 700;
             font-size: 18px;
             color: #003366;
-        }}
-        .time.delayed {{
+        }
+        .time.delayed {
             color: #e67e22;
-        }}
-        .destination {{
+        }
+        .destination {
             font-weight: 500;
             color: #333;
-        }}
-        .platform {{
+        }
+        .platform {
             text-align: center;
             font-weight: 700;
             color: #666;
-        }}
-        .status {{
+        }
+        .status {
             text-align: right;
             font-weight: 600;
             font-size: 13px;
@@ -202,31 +342,31 @@ def generate_html(data, config):
             align-items: center;
             justify-content: flex-end;
             gap: 6px;
-        }}
-        .status.ontime {{
+        }
+        .status.ontime {
             color: #27ae60;
-        }}
-        .status.delayed {{
+        }
+        .status.delayed {
             color: #e67e22;
-        }}
-        .status.cancelled {{
+        }
+        .status.cancelled {
             color: #e74c3c;
-        }}
-        .status-icon {{
+        }
+        .status-icon {
             width: 8px;
             height: 8px;
             border-radius: 50%;
-        }}
-        .status-icon.ontime {{
+        }
+        .status-icon.ontime {
             background: #27ae60;
-        }}
-        .status-icon.delayed {{
+        }
+        .status-icon.delayed {
             background: #e67e22;
-        }}
-        .status-icon.cancelled {{
+        }
+        .status-icon.cancelled {
             background: #e74c3c;
-        }}
-        .footer {{
+        }
+        .footer {
             background: #f8f9fa;
             padding: 12px 20px;
             text-align: center;
@@ -235,68 +375,143 @@ def generate_html(data, config):
             display: flex;
             justify-content: space-between;
             align-items: center;
-        }}
-        .refresh-indicator {{
+        }
+        .refresh-indicator {
             display: flex;
             align-items: center;
             gap: 8px;
-        }}
-        .spinner {{
+        }
+        .spinner {
             width: 12px;
             height: 12px;
             border: 2px solid #ddd;
             border-top-color: #003366;
             border-radius: 50%;
             animation: spin 1s linear infinite;
-        }}
-        @keyframes spin {{
-            to {{ transform: rotate(360deg); }}
-        }}
-        .empty-state {{
+        }
+        @keyframes spin {
+            to { transform: rotate(360deg); }
+        }
+        .empty-state {
             padding: 60px 20px;
             text-align: center;
             color: #666;
-        }}
-        .empty-state-icon {{
+        }
+        .empty-state-icon {
             font-size: 48px;
             margin-bottom: 16px;
-        }}
-        @media (max-width: 600px) {{
-            body {{
+        }
+        @media (max-width: 600px) {
+            body {
                 padding: 10px;
-            }}
-            .header h1 {{
+            }
+            .header h1 {
                 font-size: 22px;
-            }}
-            .board-header {{
+            }
+            .board-header {
                 display: none;
-            }}
-            .departure {{
+            }
+            .departure {
                 grid-template-columns: 1fr;
                 gap: 8px;
-            }}
-            .departure > div {{
+            }
+            .departure > div {
                 display: flex;
                 justify-content: space-between;
-            }}
-            .departure > div::before {{
+            }
+            .departure > div::before {
                 font-weight: 600;
                 color: #666;
                 font-size: 12px;
                 text-transform: uppercase;
+            }
+            .time::before { content: "Time"; }
+            .destination::before { content: "Destination"; }
+            .platform::before { content: "Platform"; }
+            .status::before { content: "Status"; }
+        }"""
+
+def render_departure_rows(departures, is_live=True):
+    """Render the departure rows of one board"""
+    departure_rows = []
+    for dep in departures:
+        status_class = 'ontime'
+        status_text = 'On Time'
+        time_class = ''
+        
+        if dep['cancelled']:
+            status_class = 'cancelled'
+            status_text = 'Cancelled'
+        elif dep['expected'] != dep['scheduled'] and dep['expected']:
+            status_class = 'delayed'
+            status_text = f"Exp {dep['expected']}"
+            time_class = 'delayed'
+        elif not is_live:
+            status_text = 'Scheduled'
+        
+        row = f'''<div class="departure">
+                <div class="time {time_class}">{dep['scheduled']}</div>
+                <div class="destination">{dep['destination']}</div>
+                <div class="platform">{dep['platform']}</div>
+                <div class="status {status_class}">
+                    <span class="status-icon {status_class}"></span>
+                    {status_text}
+                </div>
+            </div>'''
+        departure_rows.append(row)
+    
+    return '\n'.join(departure_rows) if departure_rows else '''
+            <div class="empty-state">
+                <div class="empty-state-icon">🚫</div>
+                <div>No departures found at this time</div>
+            </div>'''
+
+def render_refresh_script(refresh_interval):
+    """Countdown that reloads the page"""
+    return f'''    <script>
+        // Randomise each reload by ±25% so boards opened together drift apart
+        let seconds = Math.round({refresh_interval} * (0.75 + Math.random() * 0.5));
+        const countdownEl = document.getElementById('countdown');
+        countdownEl.textContent = seconds;
+        
+        setInterval(() => {{
+            seconds--;
+            if (seconds <= 0) {{
+                window.location.reload();
+            }} else {{
+                countdownEl.textContent = seconds;
             }}
-            .time::before {{ content: "Time"; }}
-            .destination::before {{ content: "Destination"; }}
-            .platform::before {{ content: "Platform"; }}
-            .status::before {{ content: "Status"; }}
-        }}
+        }}, 1000);
+    </script>'''
+
+def generate_html(data, config):
+    """Generate HTML departure board"""
+    if not data:
+        return generate_error_html("No data available")
+    
+    station_name = config.get('stationName', 'Kent House')
+    refresh_interval = config.get('refreshInterval', 60)
+    now_str = data['timestamp']
+    is_live = data.get('live', True)
+    board_label = 'Live Departure Board' if is_live else 'Scheduled Timetable (live feed unavailable)'
+    
+    departures_html = render_departure_rows(data['departures'], is_live)
+    
+    html = f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{station_name} Station - Live Departures</title>
+    <style>
+{BOARD_CSS}
     </style>
 </head>
 <body>
     <div class="container">
         <div class="header">
             <h1>🚆 {station_name}</h1>
-            <div class="subtitle">Live Departure Board • Updated {now_str}</div>
+            <div class="subtitle">{board_label} • Updated {now_str}</div>
         </div>
         
         <div class="board">
@@ -317,23 +532,159 @@ def generate_html(data, config):
         </div>
     </div>
     
-    <script>
-        let seconds = {refresh_interval};
-        const countdownEl = document.getElementById('countdown');
-        
-        setInterval(() => {{
-            seconds--;
-            if (seconds <= 0) {{
-                window.location.reload();
-            }} else {{
-                countdownEl.textContent = seconds;
-            }}
-        }}, 1000);
-    </script>
+{render_refresh_script(refresh_interval)}
 </body>
 </html>'''
     return html
 
+OVERVIEW_CSS = """\
+        .station {
+            margin-bottom: 20px;
+        }
+        .station h2 {
+            color: white;
+            font-size: 20px;
+            margin-bottom: 10px;
+        }"""
+
+def fetch_station_departures(station, config):
+    """Fetch one overview station, trimmed to the per-station limit"""
+    station_config = dict(config, stationCode=station['code'], stationName=station['name'])
+    data, error = fetch_transportapi_departures(station_config)
+    if data:
+        data['departures'] = data['departures'][:config.get('overviewDepartures', 5)]
+    return data, error
+
+# Overview results shared by every request in this process: station code ->
+# (submitted at, future). Concurrent misses for a station share one fetch.
+STATION_CACHE = {}
+STATION_CACHE_LOCK = threading.Lock()
+OVERVIEW_POOL = None
+
+def station_departures_future(station, config):
+    """Return a cached or in-flight fetch for the station, starting one if needed"""
+    global OVERVIEW_POOL
+    max_age = config.get('refreshInterval', 60)
+    
+    with STATION_CACHE_LOCK:
+        entry = STATION_CACHE.get(station['code'])
+        if entry:
+            submitted_at, future = entry
+            fresh = time.monotonic() - submitted_at < max_age
+            if not future.cancelled() and (not future.done() or fresh):
+                return future
+        
+        if OVERVIEW_POOL is None:
+            OVERVIEW_POOL = ThreadPoolExecutor(max_workers=config.get('overviewWorkers', 4))
+        future = OVERVIEW_POOL.submit(fetch_station_departures, station, config)
+        STATION_CACHE[station['code']] = (time.monotonic(), future)
+        return future
+
+def station_departures(station, config, future):
+    """Wait for a station's result, refetching if another viewer cancelled it"""
+    while True:
+        try:
+            return future.result()
+        except CancelledError:
+            future = station_departures_future(station, config)
+
+def render_station_section(station, data, error):
+    if error:
+        rows = f'''
+            <div class="empty-state">
+                <div class="empty-state-icon">⚠️</div>
+                <div>{error}</div>
+            </div>'''
+    else:
+        rows = render_departure_rows(data['departures'], data.get('live', True))
+    
+    return f'''
+        <div class="station">
+            <h2>🚆 {station['name']}</h2>
+            <div class="board">
+                <div class="board-header">
+                    <div>Time</div>
+                    <div>Destination</div>
+                    <div>Plat</div>
+                    <div>Status</div>
+                </div>
+{rows}
+            </div>
+        </div>
+'''
+
+def generate_overview_html(config):
+    """Yield the multi-station overview page piece by piece
+    
+    The page header goes out before waiting on any station. Stations are
+    requested a few at a time from STATION_CACHE, which reuses results for
+    refreshInterval seconds and shares in-flight fetches between viewers,
+    and each section is yielded in config order as soon as it is ready.
+    """
+    stations = config.get('overviewStations') or [
+        {'code': config['stationCode'], 'name': config.get('stationName', 'Kent House')}
+    ]
+    workers = config.get('overviewWorkers', 4)
+    refresh_interval = config.get('refreshInterval', 60)
+    now_str = datetime.now().strftime('%H:%M:%S')
+    
+    remaining = iter(stations)
+    pending = deque(
+        (station, station_departures_future(station, config))
+        for station in islice(remaining, workers)
+    )
+    
+    try:
+        
+        yield f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Line Overview - Live Departures</title>
+    <style>
+{BOARD_CSS}
+{OVERVIEW_CSS}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🚆 Line Overview</h1>
+            <div class="subtitle">{len(stations)} stations • Updated {now_str}</div>
+        </div>
+'''
+        
+        while pending:
+            station, future = pending.popleft()
+            next_station = next(remaining, None)
+            if next_station:
+                pending.append((next_station, station_departures_future(next_station, config)))
+            
+            data, error = station_departures(station, config, future)
+            yield render_station_section(station, data, error)
+    except GeneratorExit:
+        # Client went away: drop fetches that haven't started yet
+        for _, future in pending:
+            future.cancel()
+        raise
+    
+    yield f'''
+        <div class="board">
+            <div class="footer">
+                <div class="refresh-indicator">
+                    <div class="spinner"></div>
+                    <span>Refreshing in <span id="countdown">{refresh_interval}</span>s</span>
+                </div>
+                <div>Data provided by TransportAPI</div>
+            </div>
+        </div>
+    </div>
+    
+{render_refresh_script(refresh_interval)}
+</body>
+</html>'''
+
 def generate_error_html(message):
     return f'''<!DOCTYPE html>
 <html>
@@ -359,7 +710,9 @@ def main():
     # Fetch data based on configured provider
     provider = config.get('apiProvider', 'transportapi')
     
-    if provider == 'transportapi':
+    if provider == 'transportapi' and config.get('timetablePreload', False):
+        data, error = fetch_preloaded_departures(config)
+    elif provider == 'transportapi':
         data, error = fetch_transportapi_departures(config)
     else:
         data, error = None, "Unknown API provider"
@@ -377,6 +730,11 @@ def main():
     
     print(f"📄 Generated: {OUTPUT_HTML}")
     print(f"🌐 Open in browser: file://{OUTPUT_HTML}")
+    
+    if not error:
+        # Imported here: notify_changes uses parse_clock from this module
+        from notify_changes import notify_changes
+        notify_changes(data, config)
 
 if __name__ == "__main__":
     main()
@@ -200,8 +200,10 @@ def generate_html(data):
     </div>
     
     <script>
-        let seconds = 60;
+        // Randomise each reload by ±25% so boards opened together drift apart
+        let seconds = Math.round(60 * (0.75 + Math.random() * 0.5));
         const countdownEl = document.getElementById('countdown');
+        countdownEl.textContent = seconds;
         setInterval(() => {
             seconds--;
             if (seconds <= 0) {
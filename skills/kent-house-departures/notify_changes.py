@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""Diff departure snapshots and deliver change events to webhooks"""
+
+import asyncio
+import json
+import subprocess
+import sys
+import threading
+import urllib.request
+import urllib.error
+from datetime import datetime
+
+from fetch_departures import parse_clock
+
+SNAPSHOT_FILE = "/data/.openclaw/workspace/skills/kent-house-departures/last_snapshot.json"
+
+NEW_DEPARTURE = 'new_departure'
+DELAY_CHANGE = 'delay_change'
+PLATFORM_CHANGE = 'platform_change'
+CANCELLATION = 'cancellation'
+DEPARTED = 'departed'
+
+def snapshot_key(dep):
+    """Identify a departure between two parsed snapshots"""
+    return f"{dep['scheduled']}|{dep['destination']}"
+
+def make_event(event_type, dep, previous=None, current=None):
+    return {
+        'type': event_type,
+        'scheduled': dep['scheduled'],
+        'destination': dep['destination'],
+        'previous': previous,
+        'current': current
+    }
+
+def diff_departures(previous, current):
+    """Compare two parsed snapshots and return a list of change events
+
+    Only cancellations are reported unless both snapshots came from the
+    live feed; a timetable-only snapshot (live=False) has scheduled times
+    in place of expected ones, so every other comparison would be wrong.
+    A train missing from the new snapshot is only reported as departed if
+    its expected time has passed; otherwise it has just been pushed out
+    of the maxDepartures window.
+    """
+    old = {snapshot_key(dep): dep for dep in (previous or {}).get('departures', [])}
+    new = {snapshot_key(dep): dep for dep in (current or {}).get('departures', [])}
+    both_live = (previous or {}).get('live', True) and (current or {}).get('live', True)
+    now = datetime.now()
+    events = []
+
+    for key, dep in new.items():
+        before = old.get(key)
+        if before is None:
+            if both_live:
+                events.append(make_event(NEW_DEPARTURE, dep, current=dep['expected']))
+            continue
+
+        if dep['cancelled'] and not before['cancelled']:
+            events.append(make_event(CANCELLATION, dep))
+            continue
+
+        if not both_live:
+            continue
+        if dep['expected'] != before['expected']:
+            events.append(make_event(DELAY_CHANGE, dep, before['expected'], dep['expected']))
+        if dep['platform'] != before['platform']:
+            events.append(make_event(PLATFORM_CHANGE, dep, before['platform'], dep['platform']))
+
+    for key, dep in old.items():
+        if key in new or dep['cancelled'] or not both_live:
+            continue
+        expected_at = parse_clock(dep['expected'] or dep['scheduled'], now)
+        if expected_at and expected_at <= now:
+            events.append(make_event(DEPARTED, dep))
+
+    return events
+
+def load_snapshot():
+    try:
+        with open(SNAPSHOT_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_snapshot(data):
+    with open(SNAPSHOT_FILE, 'w') as f:
+        json.dump(data, f)
+
+def post_batch(url, station, batch, timeout):
+    """POST a batch of events as JSON (blocking, run off the event loop)"""
+    body = json.dumps({
+        'station': station,
+        'sent': datetime.now().strftime('%H:%M:%S'),
+        'events': batch
+    }).encode('utf-8')
+    req = urllib.request.Request(url, data=body, method='POST',
+                                 headers={'Content-Type': 'application/json'})
+    with urllib.request.urlopen(req, timeout=timeout) as response:
+        response.read()
+
+def post_in_background(url, station, batch, timeout):
+    """Run post_batch on a daemon thread and return a future for it
+
+    The thread is never joined, so a hung or trickling endpoint can be
+    abandoned at the deadline without holding up interpreter shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(error):
+        if future.done():
+            return
+        if error:
+            future.set_exception(error)
+        else:
+            future.set_result(None)
+
+    def worker():
+        error = None
+        try:
+            post_batch(url, station, batch, timeout)
+        except Exception as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(settle, error)
+        except RuntimeError:
+            pass  # loop already closed, nobody is waiting any more
+
+    threading.Thread(target=worker, daemon=True).start()
+    return future
+
+class Subscriber:
+    """A webhook endpoint with its own bounded queue
+
+    When the queue is full the oldest event is dropped, so a slow
+    endpoint only ever loses its own backlog and never blocks the
+    producer or the other subscribers.
+    """
+
+    def __init__(self, url, settings):
+        self.url = url
+        self.queue = asyncio.Queue(maxsize=settings.get('queueSize', 100))
+        self.batch_size = settings.get('batchSize', 20)
+        self.max_retries = settings.get('maxRetries', 3)
+        self.timeout = settings.get('timeout', 10)
+        self.dropped = 0
+        self.pending = 0
+
+    def offer(self, event):
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.queue.task_done()
+            self.dropped += 1
+            self.pending -= 1
+        self.queue.put_nowait(event)
+        self.pending += 1
+
+    async def run(self, station, deadline_at):
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            try:
+                await self.deliver(station, batch, deadline_at)
+            finally:
+                self.pending -= len(batch)
+                for _ in batch:
+                    self.queue.task_done()
+
+    async def deliver(self, station, batch, deadline_at):
+        loop = asyncio.get_running_loop()
+        for attempt in range(self.max_retries + 1):
+            remaining = deadline_at - loop.time()
+            if remaining <= 0:
+                print(f"⚠️  Webhook {self.url} gave up on {len(batch)} events at the deadline")
+                return
+            try:
+                future = post_in_background(self.url, station, batch, min(self.timeout, remaining))
+                await asyncio.wait_for(future, remaining)
+                return
+            except Exception as e:
+                if attempt == self.max_retries:
+                    print(f"❌ Webhook {self.url} failed after {attempt + 1} attempts: {e!r}")
+                    return
+                await asyncio.sleep(min(2 ** attempt, max(0, deadline_at - loop.time())))
+
+async def dispatch(events, station, settings):
+    """Fan events out to every webhook, giving up after the deadline"""
+    subscribers = [Subscriber(url, settings) for url in settings.get('webhooks', [])]
+    for sub in subscribers:
+        for event in events:
+            sub.offer(event)
+
+    deadline = settings.get('deadline', 30)
+    deadline_at = asyncio.get_running_loop().time() + deadline
+    workers = [asyncio.create_task(sub.run(station, deadline_at)) for sub in subscribers]
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*(sub.queue.join() for sub in subscribers)),
+            timeout=deadline
+        )
+    except asyncio.TimeoutError:
+        for sub in subscribers:
+            if sub.pending:
+                print(f"⚠️  Webhook {sub.url} still has {sub.pending} undelivered events")
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    for sub in subscribers:
+        if sub.dropped:
+            print(f"⚠️  Webhook {sub.url} dropped {sub.dropped} events (queue full)")
+
+def notify_changes(data, config):
+    """Diff against the last snapshot, store the new one and hand the
+    events to a detached delivery process
+
+    The fetch run never waits for webhooks. Delivery is best-effort:
+    events still undelivered at the deadline are dropped, not retried on
+    the next run.
+    """
+    settings = config.get('notifications', {})
+    previous = load_snapshot()
+    events = diff_departures(previous, data) if previous else []
+    save_snapshot(data)
+
+    if events and settings.get('webhooks'):
+        print(f"📣 Sending {len(events)} change events")
+        job = json.dumps({'events': events, 'station': data['station'], 'settings': settings})
+        delivery = subprocess.Popen([sys.executable, __file__], stdin=subprocess.PIPE,
+                                    start_new_session=True)
+        delivery.stdin.write(job.encode('utf-8'))
+        delivery.stdin.close()
+
+    return events
+
+def main():
+    """Deliver a batch of events read from stdin (started by notify_changes)"""
+    job = json.load(sys.stdin)
+    asyncio.run(dispatch(job['events'], job['station'], job['settings']))
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,136 @@
 import http.server
 import socketserver
 import os
+import random
+import threading
+import time
 import webbrowser
 from pathlib import Path
 
+from fetch_departures import load_config, generate_overview_html
+
 PORT = 8080
 DIRECTORY = "/data/.openclaw/workspace/skills/kent-house-departures"
 
+# Admission control defaults, overridable under "server" in config.json:
+# concurrent handlers, pending connections in the listen backlog, and a
+# per-client token bucket (burst, refill per second)
+MAX_WORKERS = 16
+REQUEST_QUEUE_SIZE = 64
+CLIENT_BURST = 20
+CLIENT_RATE = 2.0
+RETRY_AFTER_RANGE = (2, 10)
+REQUEST_TIMEOUT = 10
+
+class RateLimiter:
+    """Per-client token bucket"""
+    
+    def __init__(self, burst, rate):
+        self.burst = burst
+        self.rate = rate
+        self.buckets = {}
+        self.lock = threading.Lock()
+    
+    def allow(self, client):
+        now = time.monotonic()
+        with self.lock:
+            tokens, last = self.buckets.get(client, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+            if tokens < 1:
+                self.buckets[client] = (tokens, now)
+                return False
+            self.buckets[client] = (tokens - 1, now)
+            
+            # Forget clients whose bucket has refilled completely
+            if len(self.buckets) > 1024:
+                idle = self.burst / self.rate
+                self.buckets = {c: (t, l) for c, (t, l) in self.buckets.items() if now - l < idle}
+            return True
+
+def rejection_response(code, reason):
+    """Build a fast error response with a randomised Retry-After"""
+    retry_after = random.randint(*RETRY_AFTER_RANGE)
+    # Meta refresh so a board showing this page retries by itself
+    body = (f'<!DOCTYPE html><html><head><meta http-equiv="refresh" content="{retry_after}">'
+            f'<title>{code} {reason}</title></head>'
+            f'<body>{code} {reason}, retrying in {retry_after}s</body></html>').encode('utf-8')
+    return retry_after, body
+
+class AdmissionControlServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """Threaded server that sheds load instead of queueing it
+    
+    Connections beyond maxWorkers get an immediate 503 and clients over
+    their rate limit get a 429, both with a randomised Retry-After so a
+    synchronised burst of boards comes back spread out.
+    
+    Clients are told apart by source IP, so kiosks behind one NAT share a
+    bucket. Behind a reverse proxy, set trustProxy to key on the address
+    the proxy appends to X-Forwarded-For instead.
+    """
+    allow_reuse_address = True
+    daemon_threads = True
+    
+    def __init__(self, server_address, handler_class, settings=None):
+        settings = settings or {}
+        self.request_queue_size = settings.get('requestQueueSize', REQUEST_QUEUE_SIZE)
+        self.trust_proxy = settings.get('trustProxy', False)
+        max_workers = settings.get('maxWorkers', MAX_WORKERS)
+        client_burst = settings.get('clientBurst', CLIENT_BURST)
+        client_rate = settings.get('clientRate', CLIENT_RATE)
+        if max_workers < 1 or client_burst < 1 or client_rate <= 0:
+            raise ValueError("server settings need maxWorkers >= 1, clientBurst >= 1 and clientRate > 0")
+        self.slots = threading.BoundedSemaphore(max_workers)
+        self.limiter = RateLimiter(client_burst, client_rate)
+        super().__init__(server_address, handler_class)
+    
+    def process_request(self, request, client_address):
+        # Behind a trusted proxy every connection comes from the proxy, so
+        # the handler rate limits on X-Forwarded-For instead
+        if not self.trust_proxy and not self.limiter.allow(client_address[0]):
+            self.reject(request, 429, 'Too Many Requests')
+            return
+        if not self.slots.acquire(blocking=False):
+            self.reject(request, 503, 'Service Unavailable')
+            return
+        try:
+            super().process_request(request, client_address)
+        except Exception:
+            self.slots.release()
+            raise
+    
+    def process_request_thread(self, request, client_address):
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            self.slots.release()
+    
+    def reject(self, request, code, reason):
+        """Answer straight from the accept loop without blocking on the client"""
+        retry_after, body = rejection_response(code, reason)
+        response = (f"HTTP/1.1 {code} {reason}\r\n"
+                    f"Retry-After: {retry_after}\r\n"
+                    "Content-Type: text/html; charset=utf-8\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    "Cache-Control: no-store\r\n"
+                    "Connection: close\r\n\r\n").encode('latin-1') + body
+        try:
+            # Non-blocking throughout: drain whatever request bytes have
+            # arrived so close() doesn't reset, then send what fits in the
+            # socket buffer. A stalled client just gets closed.
+            request.setblocking(False)
+            try:
+                request.recv(65536)
+            except OSError:
+                pass
+            request.send(response)
+        except OSError:
+            pass
+        finally:
+            self.shutdown_request(request)
+
 class MyHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+    timeout = REQUEST_TIMEOUT
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, directory=DIRECTORY, **kwargs)
     
@@ -21,6 +144,62 @@ class MyHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         self.send_header('Pragma', 'no-cache')
         self.send_header('Expires', '0')
         super().end_headers()
+    
+    def parse_request(self):
+        if not super().parse_request():
+            return False
+        if not self.server.trust_proxy:
+            return True
+        
+        forwarded = self.headers.get('X-Forwarded-For', '')
+        client = forwarded.split(',')[-1].strip() or self.client_address[0]
+        if self.server.limiter.allow(client):
+            return True
+        
+        retry_after, body = rejection_response(429, 'Too Many Requests')
+        self.send_response(429)
+        self.send_header('Retry-After', str(retry_after))
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(body)
+        return False
+    
+    def do_GET(self):
+        if self.path.split('?')[0] == '/overview':
+            self.send_overview()
+        else:
+            super().do_GET()
+    
+    def send_overview(self):
+        """Stream the multi-station overview using chunked transfer encoding"""
+        chunked = self.request_version != 'HTTP/1.0'
+        if chunked:
+            self.protocol_version = 'HTTP/1.1'
+        
+        pages = generate_overview_html(load_config())
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            if chunked:
+                self.send_header('Transfer-Encoding', 'chunked')
+            self.send_header('Connection', 'close')
+            self.end_headers()
+            
+            for piece in pages:
+                data = piece.encode('utf-8')
+                if not data:
+                    continue
+                if chunked:
+                    data = f"{len(data):X}\r\n".encode('ascii') + data + b"\r\n"
+                self.wfile.write(data)
+            if chunked:
+                self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            pages.close()
 
 def main():
     index_file = os.path.join(DIRECTORY, "departure_board.html")
@@ -30,7 +209,8 @@ def main():
         print("   Run: python3 fetch_departures.py")
         return
     
-    with socketserver.TCPServer(("", PORT), MyHTTPRequestHandler) as httpd:
+    settings = load_config().get('server', {})
+    with AdmissionControlServer(("", PORT), MyHTTPRequestHandler, settings) as httpd:
         url = f"http://localhost:{PORT}/departure_board.html"
         print(f"🚆 Kent House Departure Board")
         print(f"🌐 Serving at: {url}")